@@ -50,15 +50,17 @@ def _extract_predicted_instances_data(labels: Labels) -> pd.DataFrame:
     for labeled_frame, instance in all_frame_instance_tuples:
         # Traverse the nodes of the instances's skeleton
         skeleton = instance.skeleton
+        track_name = instance.track.name if instance.track else "untracked"
         for node in skeleton.nodes:
+            point = instance.points[node]
             row_dict = dict(
                 frame_idx=labeled_frame.frame_idx,
-                x=instance.points[node].x,
-                y=instance.points[node].y,
-                score=instance.points[node].score,  # type: ignore[attr-defined]
+                x=point.x,
+                y=point.y,
+                score=point.score,  # type: ignore[attr-defined]
                 node_name=node.name,
                 skeleton_name=skeleton.name,
-                track_name=instance.track.name if instance.track else "untracked",
+                track_name=track_name,
                 video_path=labeled_frame.video.filename,
             )
             data_list.append(row_dict)
@@ -8,11 +8,22 @@ estimated, such as confidence scores.
 """
 
 from __future__ import annotations
-from attrs import define, validators, field, cmp_using
+from attrs import define, validators, field
 from typing import ClassVar, Optional, Union, cast
 from sleap_io import Skeleton, Node
 import numpy as np
-import math
+
+
+def _is_close(a: float, b: float) -> bool:
+    """Compare two coordinates with the `Point` equality tolerances.
+
+    This is equivalent to `numpy.isclose(a, b, equal_nan=True)` using
+    `Point.eq_atol` and `Point.eq_rtol`, but operates on plain floats.
+    """
+    if a == b or (a != a and b != b):
+        return True
+    diff = abs(a - b)
+    return diff != float("inf") and diff <= Point.eq_atol + Point.eq_rtol * abs(b)
 
 
 @define
@@ -44,7 +55,8 @@ class Point:
         Precision error between the respective `x` and `y` properties of two
         instances may be allowed or controlled via the `Point.eq_atol` and
         `Point.eq_rtol` class variables. Set to zero to disable their effect.
-        Internally, `numpy.isclose()` is used for the comparison:
+        The comparison follows the semantics of `numpy.isclose()` with
+        `equal_nan=True`:
         https://numpy.org/doc/stable/reference/generated/numpy.isclose.html
 
         Args:
@@ -61,16 +73,9 @@ class Point:
         # we know that we have some kind of point at this point
         other = cast(Point, other)
 
-        return bool(
-            np.all(
-                np.isclose(
-                    [self.x, self.y],
-                    [other.x, other.y],
-                    rtol=Point.eq_rtol,
-                    atol=Point.eq_atol,
-                    equal_nan=True,
-                )
-            )
+        return (
+            _is_close(self.x, other.x)
+            and _is_close(self.y, other.y)
             and (self.visible == other.visible)
             and (self.complete == other.complete)
         )
@@ -164,19 +169,28 @@ def _compare_points(
         True if `a` and `b` are considered equal, otherwise False
     """
     # First check we are speaking the same languague of nodes
-    if not set(a.keys()) == set(b.keys()):
+    if a.keys() != b.keys():
         return False
 
     # Check each point in self vs other
-    for node, point in a.items():
-        if not point == b[node]:
-            return False
+    return all(point == b[node] for node, point in a.items())
 
-    # Otherwise, return True
-    return True
 
+@define
+class _ConvertedPoints:
+    """Points that are already keyed by `Node` with values of the point type.
+
+    Assigning this as `Instance.points` skips the conversion of the points. It must
+    contain a point of the instance's point type for every node in the skeleton.
 
-@define(auto_attribs=True, slots=True, eq=True)
+    Attributes:
+        points: A dictionary with keys as `Node`s and values as `Point`s.
+    """
+
+    points: Union[dict[Node, Point], dict[Node, PredictedPoint]]
+
+
+@define(auto_attribs=True, slots=True, eq=False)
 class Instance:
     """This class represents a ground truth instance such as an animal.
 
@@ -202,42 +216,59 @@ class Instance:
     _POINT_TYPE = Point
 
     def _make_default_point(self, x, y):
-        return self._POINT_TYPE(x, y, visible=not (math.isnan(x) or math.isnan(y)))
+        # NaN is the only value that is not equal to itself.
+        return self._POINT_TYPE(x, y, visible=not (x != x or y != y))
 
     def _convert_points(self, attr, points):
         """Callback for maintaining points mappings between nodes and points."""
-        if type(points) == np.ndarray:
-            points = points.tolist()
+        if points.__class__ is _ConvertedPoints:
+            return points.points
 
-        if type(points) == list:
-            if len(points) != len(self.skeleton):
+        nodes = self.skeleton.nodes
+
+        point_type = self._POINT_TYPE
+
+        if points.__class__ is np.ndarray:
+            points = np.asarray(points, dtype="float64")
+            if len(points) != len(nodes):
                 raise ValueError(
-                    "If specifying points as a list, must provide as many points as "
+                    "If specifying points as an array, must provide as many points as "
                     "nodes in the skeleton."
                 )
-            points = {node: pt for node, pt in zip(self.skeleton.nodes, points)}
-
-        if type(points) == dict:
-            keys = [
-                node if type(node) == Node else self.skeleton[node]
-                for node in points.keys()
-            ]
-            vals = [
-                point
-                if type(point) == self._POINT_TYPE
-                else self._make_default_point(*point)
-                for point in points.values()
-            ]
-            points = {k: v for k, v in zip(keys, vals)}
-
-        missing_nodes = list(set(self.skeleton.nodes) - set(points.keys()))
-        for node in missing_nodes:
-            points[node] = self._make_default_point(x=np.nan, y=np.nan)
+            visible = ~np.isnan(points).any(axis=1)
+            points = {
+                node: point_type(x, y, visible=vis)
+                for node, (x, y), vis in zip(nodes, points.tolist(), visible.tolist())
+            }
+
+        else:
+            if points.__class__ is list:
+                if len(points) != len(nodes):
+                    raise ValueError(
+                        "If specifying points as a list, must provide as many points "
+                        "as nodes in the skeleton."
+                    )
+                points = dict(zip(nodes, points))
+
+            if points.__class__ is dict:
+                points = {
+                    (node if node.__class__ is Node else self.skeleton[node]): (
+                        point
+                        if point.__class__ is point_type
+                        else self._make_default_point(*point)
+                    )
+                    for node, point in points.items()
+                }
+
+        # Fill in missing nodes in skeleton order.
+        for node in nodes:
+            if node not in points:
+                points[node] = self._make_default_point(x=np.nan, y=np.nan)
 
         return points
 
     points: Union[dict[Node, Point], dict[Node, PredictedPoint]] = field(
-        on_setattr=_convert_points, eq=cmp_using(eq=_compare_points)  # type: ignore
+        on_setattr=_convert_points  # type: ignore
     )
     skeleton: Skeleton
     track: Optional[Track] = None
@@ -247,12 +278,41 @@ class Instance:
         """Maintain point mappings between node and points after initialization."""
         super().__setattr__("points", self._convert_points(None, self.points))
 
+    def __eq__(self, other: object) -> bool:
+        """Compare `self` and `other` for equality.
+
+        Two instances are equal if they are of the same type, have equal skeletons,
+        the same track, equal `from_predicted` instances and equal points (see
+        `Point.__eq__()`). The cheap checks are done first so that the points are
+        only compared when everything else matches.
+
+        Args:
+            self, other: instance of `Instance` to compare
+
+        Returns:
+            True if `self` and `other` are considered equal, otherwise False.
+        """
+        if other.__class__ is not self.__class__:
+            return False
+
+        # we know that we have an instance of the same type at this point
+        other = cast(Instance, other)
+
+        return (
+            len(self.points) == len(other.points)
+            and self.track is other.track
+            and (self.skeleton is other.skeleton or self.skeleton == other.skeleton)
+            and self.from_predicted == other.from_predicted
+            and _compare_points(self.points, other.points)
+        )
+
     def __getitem__(self, node: Union[int, str, Node]) -> Optional[Point]:
         """Return the point associated with a node or `None` if not set."""
-        if (type(node) == int) or (type(node) == str):
-            node = self.skeleton[node]
-        if isinstance(node, Node):
-            return self.points.get(node, None)
+        cls = node.__class__
+        if cls is Node:
+            return self.points.get(cast(Node, node), None)
+        elif cls is int or cls is str:
+            return self.points.get(self.skeleton[node], None)  # type: ignore[index]
         else:
             raise IndexError(f"Invalid indexing argument for instance: {node}")
 
@@ -268,7 +328,7 @@ class Instance:
     @property
     def is_empty(self) -> bool:
         """Return `True` if no points are visible on the instance."""
-        return self.n_visible == 0
+        return not any(pt.visible for pt in self.points.values())
 
     @classmethod
     def from_numpy(
@@ -290,11 +350,14 @@ class Instance:
 
     def numpy(self) -> np.ndarray:
         """Return the instance points as a numpy array."""
-        pts = np.full((len(self.skeleton), 2), np.nan)
-        for node, point in self.points.items():
-            if point.visible:
-                pts[self.skeleton.index(node)] = point.numpy()
-        return pts
+        missing = (np.nan, np.nan)
+        return np.array(
+            [
+                (pt.x, pt.y) if pt is not None and pt.visible else missing
+                for pt in map(self.points.get, self.skeleton.nodes)
+            ],
+            dtype="float64",
+        ).reshape(-1, 2)
 
 
 @define
@@ -322,6 +385,28 @@ class PredictedInstance(Instance):
     score: float = 0.0
     tracking_score: Optional[float] = 0
 
+    def __eq__(self, other: object) -> bool:
+        """Compare `self` and `other` for equality.
+
+        See `Instance.__eq__()` for the comparison semantics. The `score` and
+        `tracking_score` must also be equal.
+
+        Args:
+            self, other: instance of `PredictedInstance` to compare
+
+        Returns:
+            True if `self` and `other` are considered equal, otherwise False.
+        """
+        if not super().__eq__(other):
+            return False
+
+        # we know that we have a predicted instance at this point
+        other = cast(PredictedInstance, other)
+
+        return bool(
+            self.score == other.score and self.tracking_score == other.tracking_score
+        )
+
     @classmethod
     def from_numpy(  # type: ignore[override]
         cls,
@@ -336,11 +421,12 @@ class PredictedInstance(Instance):
 
         Args:
             points: A numpy array of shape `(n_nodes, 2)` corresponding to the points of
-                the skeleton. Values of `np.nan` indicate "missing" nodes.
-            point_scores: The points-level prediction score. This is an array that
-                represents the confidence with which each point in the instance was
-                predicted. This may not always be applicable depending on the model
-                type.
+                the skeleton. Values of `np.nan` indicate "missing" nodes, which will be
+                marked as not visible.
+            point_scores: The points-level prediction score. This is an array of shape
+                `(n_nodes,)` that represents the confidence with which each point in
+                the instance was predicted. This may not always be applicable depending
+                on the model type.
             instance_score: The instance detection or part grouping prediction score.
                 This is a scalar that represents the confidence with which this entire
                 instance was predicted. This may not always be applicable depending on
@@ -352,23 +438,166 @@ class PredictedInstance(Instance):
                 assignment.
             track: An optional `Track` associated with a unique animal/object across
                 frames or videos.
+
+        Raises:
+            ValueError: If the shapes of `points` or `point_scores` do not match the
+                number of nodes in the skeleton, or if `instance_score` or
+                `tracking_score` are not scalars.
         """
-        node_points = {
-            node: PredictedPoint(pt[0], pt[1], score=score)
-            for node, pt, score in zip(skeleton.nodes, points, point_scores)
-        }
-        return cls(
-            points=node_points,
-            skeleton=skeleton,
-            score=instance_score,
-            tracking_score=tracking_score,
-            track=track,
-        )
+        n_nodes = len(skeleton.nodes)
+        points = np.asarray(points, dtype="float64")
+        if points.shape != (n_nodes, 2):
+            raise ValueError(
+                "Points must be an array of shape (n_nodes, 2) with as many nodes as "
+                f"the skeleton ({n_nodes}), but got shape {points.shape}."
+            )
+        point_scores = np.asarray(point_scores, dtype="float64")
+        if point_scores.shape != (n_nodes,):
+            raise ValueError(
+                f"Point scores must be an array of shape ({n_nodes},), but got shape "
+                f"{point_scores.shape}."
+            )
+        if np.ndim(instance_score) != 0:
+            raise ValueError(f"Instance score must be a scalar: {instance_score}")
+        if tracking_score is not None and np.ndim(tracking_score) != 0:
+            raise ValueError(f"Tracking score must be a scalar: {tracking_score}")
+
+        return cls.from_numpy_batched(
+            points[None],
+            point_scores[None],
+            np.array([instance_score]),
+            skeleton,
+            tracking_scores=(
+                None if tracking_score is None else np.array([tracking_score])
+            ),
+            tracks=[track],
+        )[0]
+
+    @classmethod
+    def from_numpy_batched(
+        cls,
+        points: np.ndarray,
+        point_scores: np.ndarray,
+        instance_scores: np.ndarray,
+        skeleton: Skeleton,
+        tracking_scores: Optional[np.ndarray] = None,
+        tracks: Optional[list[Optional[Track]]] = None,
+    ) -> list["PredictedInstance"]:
+        """Create a list of instance objects from stacked numpy arrays.
+
+        This creates the same instances as calling `PredictedInstance.from_numpy()` on
+        each instance, but missing points are detected and the arrays are converted to
+        Python scalars once for the whole batch rather than once per point. One
+        `PredictedPoint` is still created for each node of each instance.
+
+        Args:
+            points: A numpy array of shape `(n_instances, n_nodes, 2)` corresponding to
+                the points of each instance. Values of `np.nan` indicate "missing"
+                nodes.
+            point_scores: A numpy array of shape `(n_instances, n_nodes)` with the
+                points-level prediction scores.
+            instance_scores: A numpy array of shape `(n_instances,)` with the instance
+                detection or part grouping prediction scores.
+            skeleton: The `Skeleton` that the instances are associated with. It should
+                have `n_nodes` nodes.
+            tracking_scores: An optional numpy array of shape `(n_instances,)` with the
+                scores associated with the `Track` assignments.
+            tracks: An optional list of length `n_instances` with the `Track` (or
+                `None`) associated with each instance.
+
+        Returns:
+            A list of `PredictedInstance`s of length `n_instances`.
+
+        Raises:
+            ValueError: If the shapes of the inputs do not match each other or the
+                number of nodes in the skeleton.
+        """
+        nodes = skeleton.nodes
+        points = np.asarray(points, dtype="float64")
+        if points.ndim != 3 or points.shape[1:] != (len(nodes), 2):
+            raise ValueError(
+                "Points must be an array of shape (n_instances, n_nodes, 2) with as "
+                f"many nodes as the skeleton ({len(nodes)}), but got shape "
+                f"{points.shape}."
+            )
+        n_instances = len(points)
+
+        point_scores = np.asarray(point_scores, dtype="float64")
+        if point_scores.shape != points.shape[:2]:
+            raise ValueError(
+                "Point scores must be an array of shape (n_instances, n_nodes) = "
+                f"{points.shape[:2]}, but got shape {point_scores.shape}."
+            )
+        instance_scores = np.asarray(instance_scores, dtype="float64")
+        if instance_scores.shape != (n_instances,):
+            raise ValueError(
+                f"Instance scores must be an array of shape ({n_instances},), but got "
+                f"shape {instance_scores.shape}."
+            )
+
+        if tracking_scores is None:
+            tracking_score_list = [None] * n_instances
+        else:
+            tracking_score_list = np.asarray(tracking_scores).tolist()
+            if len(tracking_score_list) != n_instances:
+                raise ValueError(
+                    f"Expected {n_instances} tracking scores, but got "
+                    f"{len(tracking_score_list)}."
+                )
+        if tracks is None:
+            tracks = [None] * n_instances
+        elif len(tracks) != n_instances:
+            raise ValueError(f"Expected {n_instances} tracks, but got {len(tracks)}.")
+
+        visible = ~np.isnan(points).any(axis=-1)
+        instances = []
+        for pts, scores, vis, instance_score, tracking_score, track in zip(
+            points.tolist(),
+            point_scores.tolist(),
+            visible.tolist(),
+            instance_scores.tolist(),
+            tracking_score_list,
+            tracks,
+        ):
+            node_points = {
+                node: PredictedPoint(x, y, visible=v, score=score)
+                for node, (x, y), score, v in zip(nodes, pts, scores, vis)
+            }
+            instances.append(
+                cls(
+                    points=_ConvertedPoints(node_points),  # type: ignore[arg-type]
+                    skeleton=skeleton,
+                    score=instance_score,
+                    tracking_score=tracking_score,
+                    track=track,
+                )
+            )
+        return instances
 
     def numpy(self) -> np.ndarray:
         """Return the instance points as a numpy array."""
-        pts = np.full((len(self.skeleton), 3), np.nan)
-        for node, point in self.points.items():
-            if point.visible:
-                pts[self.skeleton.index(node)] = point.numpy()
-        return pts
+        points = cast(dict[Node, PredictedPoint], self.points)
+        missing = (np.nan, np.nan, np.nan)
+        return np.array(
+            [
+                (pt.x, pt.y, pt.score) if pt is not None and pt.visible else missing
+                for pt in map(points.get, self.skeleton.nodes)
+            ],
+            dtype="float64",
+        ).reshape(-1, 3)
+
+
+def stack_instances(instances: list[Union[Instance, PredictedInstance]]) -> np.ndarray:
+    """Stack the points of a list of instances into a single numpy array.
+
+    Args:
+        instances: A list of `Instance`s or `PredictedInstance`s. These should all have
+            the same number of nodes in their skeletons.
+
+    Returns:
+        Points as a numpy array of shape `(n_instances, n_nodes, 2)`. Points that are
+        not visible will be filled with `np.nan`.
+    """
+    if len(instances) == 0:
+        return np.empty((0, 0, 2))
+    return np.stack([inst.numpy()[:, :2] for inst in instances])
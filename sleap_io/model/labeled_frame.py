@@ -6,6 +6,7 @@ The `LabeledFrame` class is a data structure that contains `Instance`s and
 
 from __future__ import annotations
 from sleap_io import Instance, PredictedInstance, Video
+from sleap_io.model.instance import stack_instances
 from attrs import define, field
 from typing import Union
 import numpy as np
@@ -55,9 +56,4 @@ class LabeledFrame:
 
             Note that the order of the instances is arbitrary.
         """
-        n_instances = len(self.instances)
-        n_nodes = len(self.instances[0]) if n_instances > 0 else 0
-        pts = np.full((n_instances, n_nodes, 2), np.nan)
-        for i, inst in enumerate(self.instances):
-            pts[i] = inst.numpy()[:, 0:2]
-        return pts
+        return stack_instances(self.instances)
@@ -89,6 +89,34 @@ class Labels:
         """Return a readable representation of the labels."""
         return self.__repr__()
 
+    def instance_track_refs(self) -> np.ndarray:
+        """Return the index of the track assigned to each instance.
+
+        Returns:
+            An array of shape `(n_instances,)` and dtype `int32` with the index into
+            `tracks` of the track assigned to each instance, ordered by
+            `labeled_frames` and then by the instances within each frame.
+
+            Instances that do not have a track assigned will be `-1`.
+
+        Raises:
+            ValueError: If an instance has a track assigned that is not in `tracks`.
+        """
+        track_inds = {track: i for i, track in enumerate(self.tracks)}
+        refs = []
+        for lf in self.labeled_frames:
+            for inst in lf:
+                if inst.track is None:
+                    refs.append(-1)
+                elif inst.track in track_inds:
+                    refs.append(track_inds[inst.track])
+                else:
+                    raise ValueError(
+                        f"Instance in frame {lf.frame_idx} has a track that is not in "
+                        f"the labels tracks: {inst.track}"
+                    )
+        return np.array(refs, dtype="int32")
+
     def numpy(
         self,
         video: Optional[Union[Video, int]] = None,
@@ -160,6 +188,7 @@ class Labels:
             tracks = np.full((n_frames, n_tracks, n_nodes, 3), np.nan, dtype="float32")
         else:
             tracks = np.full((n_frames, n_tracks, n_nodes, 2), np.nan, dtype="float32")
+        track_inds = {track: i for i, track in enumerate(self.tracks)}
         for lf in lfs:
             i = int(lf.frame_idx - first_frame)
             if untracked:
@@ -174,7 +203,7 @@ class Labels:
                     if type(inst) == PredictedInstance and inst.track is not None
                 ]
                 for inst in tracked_instances:
-                    j = self.tracks.index(inst.track)  # type: ignore[arg-type]
+                    j = track_inds[inst.track]  # type: ignore[index]
                     tracks[i, j] = (
                         inst.numpy() if return_confidence else inst.numpy()[:, 0:2]
                     )
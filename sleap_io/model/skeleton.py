@@ -142,7 +142,7 @@ class Skeleton:
     def edge_inds(self) -> list[Tuple[int, int]]:
         """Edges indices as a list of 2-tuples."""
         return [
-            (self.nodes.index(edge.source), self.nodes.index(edge.destination))
+            (self._node_ind_map[edge.source], self._node_ind_map[edge.destination])
             for edge in self.edges
         ]
 
@@ -153,7 +153,7 @@ class Skeleton:
     def index(self, node: Union[Node, str]) -> int:
         """Return the index of a node specified as a `Node` or string name."""
         if type(node) == str:
-            return self.index(self._node_name_map[node])
+            return self._node_ind_map[self._node_name_map[node]]
         elif type(node) == Node:
             return self._node_ind_map[node]
         else:
@@ -1,5 +1,6 @@
 """Tests for methods in the sleap_io.model.instance file."""
 from pickletools import pyset
+import itertools
 import numpy as np
 from numpy.testing import assert_equal
 import pytest
@@ -9,6 +10,8 @@ from sleap_io.model.instance import (
     Track,
     Instance,
     PredictedInstance,
+    stack_instances,
+    _is_close,
 )
 from sleap_io import Skeleton
 
@@ -63,6 +66,32 @@ def test_close_points():
     assert not pt1 == pt2
 
 
+@pytest.mark.parametrize("atol,rtol", [(1e-08, 0), (0, 0), (1e-03, 1e-05), (1.0, 0.5)])
+def test_is_close(monkeypatch, atol, rtol):
+    """Test that point coordinate comparison matches `numpy.isclose`."""
+    monkeypatch.setattr(Point, "eq_atol", atol)
+    monkeypatch.setattr(Point, "eq_rtol", rtol)
+    values = [
+        0.0,
+        1.0,
+        -1.0,
+        1 + 1e-9,
+        1 + 1e-6,
+        3.0,
+        1e10,
+        1e10 + 1,
+        1e308,
+        -1e308,
+        np.nan,
+        np.inf,
+        -np.inf,
+    ]
+    for a, b in itertools.product(values, values):
+        with np.errstate(over="ignore", invalid="ignore"):
+            expected = bool(np.isclose(a, b, rtol=rtol, atol=atol, equal_nan=True))
+        assert _is_close(a, b) == expected, (a, b)
+
+
 def test_predicted_point():
     """Test `PredictedPoint` is initialized as expected."""
     ppt1 = PredictedPoint(x=1.2, y=3.4, visible=True, complete=False, score=0.9)
@@ -106,6 +135,14 @@ def test_instance():
     inst = Instance(np.array([[1, 2], [3, 4]]), skeleton=Skeleton(["A", "B"]))
     assert_equal(inst.numpy(), [[1, 2], [3, 4]])
 
+    inst = Instance(np.array([[1, np.nan], [3, 4]]), skeleton=Skeleton(["A", "B"]))
+    assert not inst[0].visible
+    assert inst[1].visible
+    assert type(inst[1].x) == float
+
+    with pytest.raises(ValueError):
+        Instance(np.array([[1, 2]]), skeleton=Skeleton(["A", "B"]))
+
     inst = Instance.from_numpy([[1, 2], [3, 4]], skeleton=Skeleton(["A", "B"]))
     assert_equal(inst.numpy(), [[1, 2], [3, 4]])
 
@@ -119,6 +156,24 @@ def test_instance():
     assert inst.n_visible == 0
     assert inst.is_empty
 
+    # Test that changing point visibility in place is reflected.
+    inst = Instance([[1, 2], [3, 4]], skeleton=Skeleton(["A", "B"]))
+    inst["A"].visible = False
+    assert inst.n_visible == 1
+    assert not inst.is_empty
+    inst["B"].visible = False
+    assert inst.n_visible == 0
+    assert inst.is_empty
+
+    inst.points = {"B": [5, 6]}
+    assert_equal(inst.numpy(), [[np.nan, np.nan], [5, 6]])
+    assert inst.n_visible == 1
+
+    # Test that modifying the returned array does not affect the instance.
+    pts = inst.numpy()
+    pts[1] = 0
+    assert_equal(inst.numpy(), [[np.nan, np.nan], [5, 6]])
+
     with pytest.raises(ValueError):
         Instance([[1, 2]], skeleton=Skeleton(["A", "B"]))
 
@@ -126,6 +181,36 @@ def test_instance():
         inst[None]
 
 
+def test_instance_modify_points():
+    """Test that modifying the points of an `Instance` in place is reflected."""
+    skel = Skeleton(["A", "B"])
+    inst = Instance([[1, 2], [3, 4]], skeleton=skel)
+    inst["A"].x = 10
+    inst["B"].visible = False
+    assert_equal(inst.numpy(), [[10, 2], [np.nan, np.nan]])
+    assert inst.n_visible == 1
+    assert_equal(stack_instances([inst]), [[[10, 2], [np.nan, np.nan]]])
+
+    inst.points[skel.nodes[1]] = Point(7, 7)
+    assert_equal(inst.numpy(), [[10, 2], [7, 7]])
+    assert inst.n_visible == 2
+
+    # Equality and numpy() should agree after in place modifications.
+    inst2 = Instance([[10, 2], [7, 7]], skeleton=skel)
+    assert inst == inst2
+    assert_equal(inst.numpy(), inst2.numpy())
+    inst2["A"].y = 5
+    assert not inst == inst2
+    assert_equal(inst2.numpy(), [[10, 5], [7, 7]])
+
+    inst = PredictedInstance.from_numpy(
+        [[0, 1], [2, 3]], [0.4, 0.5], instance_score=0.6, skeleton=skel
+    )
+    inst["A"].score = 0.9
+    inst["B"].visible = False
+    assert_equal(inst.numpy(), [[0, 1, 0.9], [np.nan, np.nan, np.nan]])
+
+
 def test_instance_comparison():
     """Test some properties of `Instance` equality semantics"""
     # test that instances with different skeletons are not considered equal
@@ -138,6 +223,29 @@ def test_instance_comparison():
     inst2 = Instance({"A": [2, 3], "B": [0, 1]}, skeleton=Skeleton(["A", "B"]))
     assert not inst1 == inst2
 
+    # test that instances with equal skeletons and points are considered equal
+    inst2 = Instance({"A": [0, 1], "B": [2, 3]}, skeleton=Skeleton(["A", "B"]))
+    assert inst1 == inst2
+
+    # test that instances with different tracks are not considered equal
+    inst2 = Instance(
+        {"A": [0, 1], "B": [2, 3]}, skeleton=inst1.skeleton, track=Track("A")
+    )
+    assert not inst1 == inst2
+
+    # test that instances are not equal to predicted instances
+    inst2 = PredictedInstance({"A": [0, 1], "B": [2, 3]}, skeleton=inst1.skeleton)
+    assert not inst1 == inst2
+    assert not inst2 == inst1
+
+    # test that predicted instances with different scores are not considered equal
+    inst1 = PredictedInstance(
+        {"A": [0, 1], "B": [2, 3]}, skeleton=inst2.skeleton, score=0.5
+    )
+    assert not inst1 == inst2
+    inst2.score = 0.5
+    assert inst1 == inst2
+
 
 def test_predicted_instance():
     """Test initialization and creation of `PredictedInstance` object."""
@@ -152,3 +260,104 @@ def test_predicted_instance():
     assert inst[0].score == 0.4
     assert inst[1].score == 0.5
     assert inst.score == 0.6
+
+    inst = PredictedInstance.from_numpy(
+        [[np.nan, np.nan], [2, 3]], [0.4, 0.5], 0.6, skeleton=Skeleton(["A", "B"])
+    )
+    assert not inst[0].visible
+    assert inst.n_visible == 1
+
+    with pytest.raises(ValueError):
+        PredictedInstance.from_numpy(
+            [[0, 1]], [0.4], instance_score=0.6, skeleton=Skeleton(["A", "B"])
+        )
+    with pytest.raises(ValueError):
+        PredictedInstance.from_numpy(
+            [[0, 1], [2, 3]], [0.4], instance_score=0.6, skeleton=Skeleton(["A", "B"])
+        )
+    with pytest.raises(ValueError):
+        PredictedInstance.from_numpy(
+            [[0, 1], [2, 3]],
+            [0.4, 0.5],
+            instance_score=[0.6, 0.7],
+            skeleton=Skeleton(["A", "B"]),
+        )
+
+    inst.points = [[np.nan, np.nan], [4, 5]]
+    assert_equal(inst.numpy(), [[np.nan, np.nan, np.nan], [4, 5, 0]])
+
+
+def test_predicted_instance_from_numpy_batched():
+    """Test creation of multiple `PredictedInstance`s from stacked arrays."""
+    skel = Skeleton(["A", "B"])
+    track = Track("A")
+    insts = PredictedInstance.from_numpy_batched(
+        np.array([[[0, 1], [2, 3]], [[np.nan, np.nan], [4, 5]]]),
+        np.array([[0.1, 0.2], [0.3, 0.4]]),
+        np.array([0.5, 0.6]),
+        skeleton=skel,
+        tracks=[track, None],
+    )
+    assert len(insts) == 2
+    assert_equal(insts[0].numpy(), [[0, 1, 0.1], [2, 3, 0.2]])
+    assert_equal(insts[1].numpy(), [[np.nan, np.nan, np.nan], [4, 5, 0.4]])
+    assert type(insts[0]["A"]) == PredictedPoint
+    assert not insts[1]["A"].visible
+    assert insts[1].n_visible == 1
+    assert insts[0].score == 0.5
+    assert insts[0].track is track
+    assert insts[1].track is None
+    assert insts[0].tracking_score is None
+
+    # Test that the batched constructor agrees with `PredictedInstance.from_numpy`.
+    for inst, pts, scores, score in zip(
+        insts,
+        [[[0, 1], [2, 3]], [[np.nan, np.nan], [4, 5]]],
+        [[0.1, 0.2], [0.3, 0.4]],
+        [0.5, 0.6],
+    ):
+        inst2 = PredictedInstance.from_numpy(
+            pts, scores, instance_score=score, skeleton=skel, track=inst.track
+        )
+        assert inst == inst2
+        assert inst.n_visible == inst2.n_visible
+
+    with pytest.raises(ValueError):
+        PredictedInstance.from_numpy_batched(
+            np.zeros((2, 2, 2)), np.zeros((1, 2)), np.zeros(2), skeleton=skel
+        )
+    with pytest.raises(ValueError):
+        PredictedInstance.from_numpy_batched(
+            np.zeros((2, 3, 2)), np.zeros((2, 3)), np.zeros(2), skeleton=skel
+        )
+    with pytest.raises(ValueError):
+        PredictedInstance.from_numpy_batched(
+            np.zeros((2, 2, 2)), np.zeros((2, 2)), np.zeros(1), skeleton=skel
+        )
+    with pytest.raises(ValueError):
+        PredictedInstance.from_numpy_batched(
+            np.zeros((2, 2, 2)),
+            np.zeros((2, 2)),
+            np.zeros(2),
+            skeleton=skel,
+            tracks=[track],
+        )
+    with pytest.raises(ValueError):
+        PredictedInstance.from_numpy_batched(
+            np.zeros((2, 2, 2)),
+            np.zeros((2, 2)),
+            np.zeros(2),
+            skeleton=skel,
+            tracking_scores=np.zeros(3),
+        )
+
+
+def test_stack_instances():
+    """Test stacking the points of multiple instances into a single array."""
+    skel = Skeleton(["A", "B"])
+    insts = [
+        Instance([[0, 1], [np.nan, np.nan]], skeleton=skel),
+        PredictedInstance([[4, 5], [6, 7]], skeleton=skel),
+    ]
+    assert_equal(stack_instances(insts), [[[0, 1], [np.nan, np.nan]], [[4, 5], [6, 7]]])
+    assert stack_instances([]).shape == (0, 0, 2)
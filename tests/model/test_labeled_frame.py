@@ -25,3 +25,5 @@ def test_labeled_frame():
 
     # Test LabeledFrame.__getitem__ method
     assert lf[0] == inst
+
+    assert LabeledFrame(video=lf.video, frame_idx=1).numpy().shape == (0, 0, 2)
@@ -1,7 +1,15 @@
 """Test methods and functions in the sleap_io.model.labels file."""
 from numpy.testing import assert_equal
+import numpy as np
 import pytest
-from sleap_io import Video, Skeleton, Instance, PredictedInstance, LabeledFrame
+from sleap_io import (
+    Video,
+    Skeleton,
+    Instance,
+    PredictedInstance,
+    LabeledFrame,
+    Track,
+)
 from sleap_io.model.labels import Labels
 
 
@@ -34,6 +42,55 @@ def test_labels():
     assert str(labels) == "Labels(labeled_frames=1, videos=1, skeletons=1, tracks=0)"
 
 
+def test_labels_instance_track_refs():
+    """Test getting the track indices of all instances in `Labels`."""
+    skel = Skeleton(["A", "B"])
+    video = Video(filename="test", shape=(1, 1, 1, 1))
+    track_a, track_b = Track("A"), Track("B")
+    labels = Labels(
+        [
+            LabeledFrame(
+                video=video,
+                frame_idx=0,
+                instances=[
+                    PredictedInstance([[0, 1], [2, 3]], skeleton=skel, track=track_b),
+                    Instance([[4, 5], [6, 7]], skeleton=skel),
+                ],
+            ),
+            LabeledFrame(
+                video=video,
+                frame_idx=1,
+                instances=[
+                    PredictedInstance([[0, 1], [2, 3]], skeleton=skel, track=track_a)
+                ],
+            ),
+        ]
+    )
+    assert labels.tracks == [track_b, track_a]
+
+    refs = labels.instance_track_refs()
+    assert refs.dtype == np.int32
+    assert_equal(refs, [0, -1, 1])
+
+    # Test that tracks missing from `Labels.tracks` are not treated as untracked.
+    track_c = Track("C")
+    labels.labeled_frames.append(
+        LabeledFrame(
+            video=video,
+            frame_idx=2,
+            instances=[
+                PredictedInstance([[0, 1], [2, 3]], skeleton=skel, track=track_c)
+            ],
+        )
+    )
+    with pytest.raises(ValueError):
+        labels.instance_track_refs()
+    labels.tracks.append(track_c)
+    assert_equal(labels.instance_track_refs(), [0, -1, 1, 2])
+
+    assert Labels().instance_track_refs().shape == (0,)
+
+
 def test_labels_numpy(labels_predictions: Labels):
     trx = labels_predictions.numpy(video=None, untracked=False)
     assert trx.shape == (1100, 27, 24, 2)